@@ -15,15 +15,19 @@ if not exist "models\pipelines_by_target.pkl" (
 )
 
 echo.
-echo 3. 开始打包...
+echo 3. 由logo.jpg生成缩放后的logo...
+.venv\Scripts\python.exe src/make_logo.py
+
+echo.
+echo 4. 开始打包...
 .venv\Scripts\pyinstaller.exe build.spec
 
 echo.
-echo 4. 打包完成！
+echo 5. 打包完成！
 echo 可执行文件位置：dist\氯碱工业理化常数计算软件V1.0.exe
 echo.
 
-echo 5. 清理临时文件...
+echo 6. 清理临时文件...
 if exist "build" rmdir /s /q build
 if exist "__pycache__" rmdir /s /q __pycache__
 if exist "src\__pycache__" rmdir /s /q src\__pycache__
@@ -0,0 +1,77 @@
+"""HCl vapor pressure engineered features, shared by train.py and predict_gui.py.
+
+HCL_FEATURES is the single definition of the column order; both builders write
+each feature into the column of its name, so the order cannot drift between them.
+"""
+import math
+
+import numpy as np
+
+# Column order of the HCl engineered features (the saved model's feature list follows it)
+HCL_FEATURES = (
+    "X1", "X2", "inv_T", "log_T", "sqrt_T",
+    "log_X1", "sqrt_X1", "X1_squared",
+    "X1_inv_T", "X1_log_T", "X1_sqrt_T",
+    "X1_X2", "X1_X2_inv_T",
+    "exp_inv_T", "X1_exp_inv_T",
+)
+_COL = {name: i for i, name in enumerate(HCL_FEATURES)}
+
+def build_hcl_features(x1, x2, out):
+    """Fill the HCl engineered features into the preallocated (n_samples, 15) array `out` in one pass"""
+    out[:, _COL["X1"]] = x1
+    out[:, _COL["X2"]] = x2
+    
+    # Temperature in Kelvin; basic physics-based features
+    T_K    = x2 + 273.15
+    inv_T  = np.divide(1.0, T_K, out=out[:, _COL["inv_T"]])
+    log_T  = np.log(T_K, out=out[:, _COL["log_T"]])
+    sqrt_T = np.sqrt(T_K, out=out[:, _COL["sqrt_T"]])
+    
+    # Concentration-based features
+    np.log(x1 + 1, out=out[:, _COL["log_X1"]])
+    np.sqrt(x1, out=out[:, _COL["sqrt_X1"]])
+    np.multiply(x1, x1, out=out[:, _COL["X1_squared"]])
+    
+    # Interaction terms
+    np.multiply(x1, inv_T, out=out[:, _COL["X1_inv_T"]])
+    np.multiply(x1, log_T, out=out[:, _COL["X1_log_T"]])
+    np.multiply(x1, sqrt_T, out=out[:, _COL["X1_sqrt_T"]])
+    
+    # Advanced interactions
+    x1_x2 = np.multiply(x1, x2, out=out[:, _COL["X1_X2"]])
+    np.multiply(x1_x2, inv_T, out=out[:, _COL["X1_X2_inv_T"]])
+    
+    # Exponential/logarithmic combinations
+    exp_inv_T = np.exp(inv_T, out=out[:, _COL["exp_inv_T"]])
+    np.multiply(x1, exp_inv_T, out=out[:, _COL["X1_exp_inv_T"]])
+    return out
+
+def fill_hcl_features_row(x1, x2, row):
+    """Scalar fast path of build_hcl_features for one sample: fill the 15 features into the 1-D array `row`.
+
+    Uses math on Python floats (numpy ufuncs on scalars cost far more than the arithmetic itself).
+    """
+    T_K       = x2 + 273.15
+    inv_T     = 1.0 / T_K
+    log_T     = math.log(T_K)
+    sqrt_T    = math.sqrt(T_K)
+    exp_inv_T = math.exp(inv_T)
+    x1_x2     = x1 * x2
+    
+    row[_COL["X1"]]           = x1
+    row[_COL["X2"]]           = x2
+    row[_COL["inv_T"]]        = inv_T
+    row[_COL["log_T"]]        = log_T
+    row[_COL["sqrt_T"]]       = sqrt_T
+    row[_COL["log_X1"]]       = math.log(x1 + 1)
+    row[_COL["sqrt_X1"]]      = math.sqrt(x1)
+    row[_COL["X1_squared"]]   = x1 * x1
+    row[_COL["X1_inv_T"]]     = x1 * inv_T
+    row[_COL["X1_log_T"]]     = x1 * log_T
+    row[_COL["X1_sqrt_T"]]    = x1 * sqrt_T
+    row[_COL["X1_X2"]]        = x1_x2
+    row[_COL["X1_X2_inv_T"]]  = x1_x2 * inv_T
+    row[_COL["exp_inv_T"]]    = exp_inv_T
+    row[_COL["X1_exp_inv_T"]] = x1 * exp_inv_T
+    return row
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""Regenerate fig/logo_45.png, the pre-sized header logo loaded by predict_gui.py, from fig/logo.jpg.
+
+Run after changing fig/logo.jpg (build.bat runs it before packaging).
+"""
+from pathlib import Path
+
+from PIL import Image
+
+FIG_DIR     = Path(__file__).parent.parent / "fig"
+LOGO_HEIGHT = 45  # must match the header logo height in predict_gui.py
+
+def main():
+    logo = Image.open(FIG_DIR / "logo.jpg")
+    width = int(LOGO_HEIGHT * logo.width / logo.height)
+    out_path = FIG_DIR / f"logo_{LOGO_HEIGHT}.png"
+    # resized once offline, so use the highest-quality filter
+    logo.resize((width, LOGO_HEIGHT), Image.Resampling.LANCZOS).save(out_path, optimize=True)
+    print(f"Saved {width}x{LOGO_HEIGHT} logo to {out_path}")
+
+if __name__ == "__main__":
+    main()
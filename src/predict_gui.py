@@ -1,88 +1,513 @@
 #!/usr/bin/env python3
+import os
+
+# 单行预测时BLAS线程池的调度同步开销远大于计算本身，限制为单线程 (必须在导入numpy之前设置)
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+import re
 import sys
+import math
+import queue
+import threading
+import warnings
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pandas as pd
-import joblib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+import numpy as np
 from pathlib import Path
-from PIL import Image, ImageTk
+
+from hcl_features import HCL_FEATURES, fill_hcl_features_row
+
+@contextmanager
+def _positional_features():
+    """模型使用DataFrame训练，推理时按位置传入ndarray (列顺序已在加载模型时核对)，
+    仅在此范围内忽略sklearn的特征名警告 (sklearn调用只在单个后台线程中依次进行)"""
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="X does not have valid feature names")
+        yield
+
+# 压力单位 -> bar.A 换算系数
+_PRESSURE_TO_BAR = {
+    "bar.A": 1.0,
+    "kPa.A": 0.01,        # 1 bar = 100 kPa
+    "MPa.A": 10.0,        # 1 MPa = 10 bar
+    "kg/cm2.A": 0.980665, # 1 kg/cm2 = 0.980665 bar
+}
+
+# mmHg -> 蒸汽压显示单位 换算系数
+_MMHG_TO = {
+    "mmHg": 1.0,
+    "kPa": 0.133322,    # 1 mmHg = 0.133322 kPa
+    "bar": 0.00133322,  # 1 mmHg = 0.00133322 bar
+    "atm": 0.00131579,  # 1 mmHg = 0.00131579 atm
+    "psi": 0.0193368,   # 1 mmHg = 0.0193368 psi
+    "torr": 1.0,        # 1 mmHg = 1 torr
+}
+
+# 属性名称修正表: 化学式大小写、术语，以及为保证对齐而缩短的长名称 (最多22个字符)
+_PROPERTY_NAME_REPLACEMENTS = {
+    "Naoh": "NaOH",
+    "Nacl": "NaCl",
+    "Hcl": "HCl",
+    "Bubblepoint": "Bubble Point Temp",
+    "Bubble Point Temperature": "Bubble Point Temp",
+    "Thermal Conductivity": "Thermal Cond.",
+    "Vapor Pressure": "Vapor Press.",
+}
+_PROPERTY_NAME_RE = re.compile("|".join(re.escape(k) for k in _PROPERTY_NAME_REPLACEMENTS))
+
+# 输入范围 (依次为 浓度X1, 温度X2, 压力X3, 密度X4) 及超出范围时的提示
+_INPUT_MIN = np.array([0.0, -50.0, -np.inf, -np.inf])            # 含下限
+_INPUT_MIN_EXCLUSIVE = np.array([-np.inf, -np.inf, 0.0, 0.0])  # 不含下限 (必须为正)
+_INPUT_MAX = np.array([100.0, 500.0, np.inf, 5000.0])
+_INPUT_ERRORS = (
+    "浓度应在 0-100% 之间",
+    "温度应在 -50°C 到 500°C 之间",
+    "压力必须为正值",
+    "密度应在 0-5000 kg/m³ 之间",
+)
+
+# 支持的溶液类型
+_SOLUTION_TYPES = ("NaOH", "NaCl", "HCl")
+
+@dataclass
+class ModelMeta:
+    """单个模型的元数据，在加载时一次性计算"""
+    stem: str
+    display_name: str
+    property_name: str  # 去掉溶液类型前缀的属性名称 (公式选择器中使用)
+    unit: str
+    kind: str  # "bubblepoint" / "concentration" / "hcl_vapor" / "standard"
+    feature_cols: tuple
+    pipe: Any
+    is_vapor_pressure: bool = False  # 蒸汽压模型 (输出为mmHg，显示时按所选单位换算)
+    expanded_coeffs: dict = None  # 多项式模型展开后的公式系数
+    formula_info: Any = None      # 缓存的公式显示信息
+    fast_eval: Any = None         # 多项式模型的闭式求值函数 (已与sklearn结果核对)
+    preprocess: Any = None        # 管道中回归器之前的预处理部分
+    regressor: Any = None         # 管道最后的回归器
+    prep_key: Any = None          # 预处理参数指纹，相同者可共用变换结果
+
+# 各类模型的样本构建方法按此顺序填充输入列，模型保存的特征顺序必须与之一致
+_KIND_FEATURES = {
+    "bubblepoint": ("X1", "X3"),
+    "concentration": ("X2", "X4"),
+    "hcl_vapor": HCL_FEATURES,
+    "standard": ("X1", "X2"),
+}
+
+def classify_model(stem):
+    """根据模型名称判断输入样本的构建方式"""
+    if "bubblepoint" in stem:
+        return "bubblepoint"
+    elif "concentration" in stem:
+        return "concentration"
+    elif "HCl" in stem and "vapor_pressure" in stem:
+        return "hcl_vapor"
+    else:
+        return "standard"
+
+def expand_polynomial_coefficients(scaler, poly, regressor):
+    """将 标准化 -> 多项式特征 -> 线性回归 展开为原始变量的多项式系数 (2个输入变量，最高3次)"""
+    # 处理TransformedTargetRegressor
+    if hasattr(regressor, 'regressor_'):
+        regressor = regressor.regressor_
+    
+    scale_mean = scaler.mean_
+    scale_std = scaler.scale_
+    coefficients = regressor.coef_
+    intercept = regressor.intercept_
+    degree = poly.degree
+    
+    if len(scale_mean) != 2:
+        return None
+    
+    mean1, mean2 = scale_mean[0], scale_mean[1]
+    std1, std2 = scale_std[0], scale_std[1]
+    
+    # 获取特征名称以正确映射系数
+    feature_names = poly.get_feature_names_out(['X1', 'X2'])
+    
+    # 构建系数映射
+    coeff_map = {}
+    for i, feature_name in enumerate(feature_names):
+        if i < len(coefficients):
+            coeff_map[feature_name] = coefficients[i]
+    
+    # 计算展开的系数
+    expanded_coeffs = {}
+    
+    # 常数项
+    expanded_coeffs['constant'] = intercept
+    
+    # 一次项系数
+    expanded_coeffs['X1'] = 0
+    expanded_coeffs['X2'] = 0
+    
+    # 二次项系数  
+    expanded_coeffs['X1^2'] = 0
+    expanded_coeffs['X1*X2'] = 0
+    expanded_coeffs['X2^2'] = 0
+    
+    # 三次项系数（如果适用）
+    if degree >= 3:
+        expanded_coeffs['X1^3'] = 0
+        expanded_coeffs['X1^2*X2'] = 0
+        expanded_coeffs['X1*X2^2'] = 0
+        expanded_coeffs['X2^3'] = 0
+    
+    # 展开标准化变换的影响
+    for feature_name, coeff in coeff_map.items():
+        if feature_name == 'X1':
+            expanded_coeffs['constant'] -= coeff * mean1 / std1
+            expanded_coeffs['X1'] += coeff / std1
+        elif feature_name == 'X2':
+            expanded_coeffs['constant'] -= coeff * mean2 / std2
+            expanded_coeffs['X2'] += coeff / std2
+        elif feature_name == 'X1^2':
+            expanded_coeffs['constant'] += coeff * (mean1**2) / (std1**2)
+            expanded_coeffs['X1'] -= coeff * 2 * mean1 / (std1**2)
+            expanded_coeffs['X1^2'] += coeff / (std1**2)
+        elif feature_name == 'X1 X2':
+            expanded_coeffs['constant'] += coeff * mean1 * mean2 / (std1 * std2)
+            expanded_coeffs['X1'] -= coeff * mean2 / (std1 * std2)
+            expanded_coeffs['X2'] -= coeff * mean1 / (std1 * std2)
+            expanded_coeffs['X1*X2'] += coeff / (std1 * std2)
+        elif feature_name == 'X2^2':
+            expanded_coeffs['constant'] += coeff * (mean2**2) / (std2**2)
+            expanded_coeffs['X2'] -= coeff * 2 * mean2 / (std2**2)
+            expanded_coeffs['X2^2'] += coeff / (std2**2)
+        elif degree >= 3:
+            # 三次项展开
+            if feature_name == 'X1^3':
+                expanded_coeffs['constant'] -= coeff * (mean1**3) / (std1**3)
+                expanded_coeffs['X1'] += coeff * 3 * (mean1**2) / (std1**3)
+                expanded_coeffs['X1^2'] -= coeff * 3 * mean1 / (std1**3)
+                expanded_coeffs['X1^3'] += coeff / (std1**3)
+            elif feature_name == 'X1^2 X2':
+                expanded_coeffs['constant'] -= coeff * (mean1**2) * mean2 / (std1**2 * std2)
+                expanded_coeffs['X1'] += coeff * 2 * mean1 * mean2 / (std1**2 * std2)
+                expanded_coeffs['X2'] += coeff * (mean1**2) / (std1**2 * std2)
+                expanded_coeffs['X1^2'] -= coeff * mean2 / (std1**2 * std2)
+                expanded_coeffs['X1*X2'] -= coeff * 2 * mean1 / (std1**2 * std2)
+                expanded_coeffs['X1^2*X2'] += coeff / (std1**2 * std2)
+            elif feature_name == 'X1 X2^2':
+                expanded_coeffs['constant'] -= coeff * mean1 * (mean2**2) / (std1 * std2**2)
+                expanded_coeffs['X1'] += coeff * (mean2**2) / (std1 * std2**2)
+                expanded_coeffs['X2'] += coeff * mean1 * 2 * mean2 / (std1 * std2**2)
+                expanded_coeffs['X1*X2'] -= coeff * 2 * mean2 / (std1 * std2**2)
+                expanded_coeffs['X2^2'] -= coeff * mean1 / (std1 * std2**2)
+                expanded_coeffs['X1*X2^2'] += coeff / (std1 * std2**2)
+            elif feature_name == 'X2^3':
+                expanded_coeffs['constant'] -= coeff * (mean2**3) / (std2**3)
+                expanded_coeffs['X2'] += coeff * 3 * (mean2**2) / (std2**3)
+                expanded_coeffs['X2^2'] -= coeff * 3 * mean2 / (std2**3)
+                expanded_coeffs['X2^3'] += coeff / (std2**3)
+    
+    return expanded_coeffs
+
+def format_polynomial(expanded_coeffs, degree):
+    """将展开后的系数组合为多项式字符串 - 使用更高精度"""
+    terms = []
+    
+    # 常数项
+    terms.append(f"{expanded_coeffs['constant']:.12f}")
+    
+    # 添加各项（如果系数足够大）
+    threshold = 1e-12
+    
+    if abs(expanded_coeffs['X1']) > threshold:
+        terms.append(f"{expanded_coeffs['X1']:.12f}*X1")
+    if abs(expanded_coeffs['X2']) > threshold:
+        terms.append(f"{expanded_coeffs['X2']:.12f}*X2")
+    if abs(expanded_coeffs['X1^2']) > threshold:
+        terms.append(f"{expanded_coeffs['X1^2']:.12f}*X1^2")
+    if abs(expanded_coeffs['X1*X2']) > threshold:
+        terms.append(f"{expanded_coeffs['X1*X2']:.12f}*X1*X2")
+    if abs(expanded_coeffs['X2^2']) > threshold:
+        terms.append(f"{expanded_coeffs['X2^2']:.12f}*X2^2")
+        
+    if degree >= 3:
+        if abs(expanded_coeffs['X1^3']) > threshold:
+            terms.append(f"{expanded_coeffs['X1^3']:.12f}*X1^3")
+        if abs(expanded_coeffs['X1^2*X2']) > threshold:
+            terms.append(f"{expanded_coeffs['X1^2*X2']:.12f}*X1^2*X2")
+        if abs(expanded_coeffs['X1*X2^2']) > threshold:
+            terms.append(f"{expanded_coeffs['X1*X2^2']:.12f}*X1*X2^2")
+        if abs(expanded_coeffs['X2^3']) > threshold:
+            terms.append(f"{expanded_coeffs['X2^3']:.12f}*X2^3")
+    
+    # 组合多项式
+    polynomial = terms[0]  # 常数项
+    for term in terms[1:]:
+        if term.startswith('-'):
+            polynomial += f" - {term[1:]}"  # 负号已经在项中
+        else:
+            polynomial += f" + {term}"
+    return polynomial
+
+def make_polynomial_evaluator(scaler, poly, regressor):
+    """将 标准化 -> 多项式特征 -> 线性回归 融合并生成专用的求值函数 f(x0, x1, ...)，绕过sklearn管道的逐级调用
+    
+    按模型参数生成Python源码 (常数直接写入代码) 并编译一次，求值时只做标量浮点运算。
+    仍在标准化空间中计算各项 (数值条件优于展开后的原始变量多项式)，适用于任意特征数和次数。
+    对数变换模型 (TransformedTargetRegressor, inverse_func为np.exp) 对结果取exp，其他目标变换返回None。
+    """
+    log_target = False
+    if hasattr(regressor, 'regressor_'):
+        if regressor.inverse_func is not np.exp:
+            return None
+        log_target = True
+        regressor = regressor.regressor_
+    
+    mean = np.asarray(scaler.mean_, dtype=np.float64)
+    scale = np.asarray(scaler.scale_, dtype=np.float64)
+    powers = np.asarray(poly.powers_)
+    coef = np.asarray(regressor.coef_, dtype=np.float64).ravel()
+    intercept = float(np.ravel(regressor.intercept_)[0])
+    if powers.shape != (coef.size, mean.size):
+        return None
+    
+    n_features = mean.size
+    args = ", ".join(f"x{i}" for i in range(n_features))
+    lines = [f"def _evaluate({args}):"]
+    for i in range(n_features):
+        lines.append(f"    z{i} = (x{i} - {float(mean[i])!r}) / {float(scale[i])!r}")
+        # 各变量的高次幂只计算一次 (z0_2 = z0*z0, z0_3 = z0_2*z0, ...)，各单项式直接复用
+        for p in range(2, int(powers[:, i].max()) + 1):
+            prev = f"z{i}" if p == 2 else f"z{i}_{p - 1}"
+            lines.append(f"    z{i}_{p} = {prev} * z{i}")
+    
+    terms = [repr(intercept)]
+    for c, row in zip(coef.tolist(), powers.tolist()):
+        if c == 0.0:
+            continue
+        factors = [f"z{i}" if p == 1 else f"z{i}_{p}" for i, p in enumerate(row) if p > 0]
+        terms.append("*".join([f"({c!r})"] + factors))
+    y = " + ".join(terms)
+    lines.append(f"    return exp({y})" if log_target else f"    return {y}")
+    
+    namespace = {"exp": math.exp}
+    exec(compile("\n".join(lines), f"<poly {poly.degree}x{n_features}>", "exec"), namespace)
+    return namespace["_evaluate"]
+
+def preprocessing_key(pipe):
+    """生成管道预处理步骤 (除最后的回归器外) 的指纹: 对整个已拟合的预处理部分 (含超参数和拟合参数) 取哈希，
+    只有变换结果必然相同的管道指纹才相同"""
+    import joblib  # 仅在加载模型后调用，此时joblib已导入
+    return joblib.hash(pipe[:-1])
+
+# 已加载的模型 (按文件路径缓存)，同一进程内再次创建窗口时无需重新加载
+_MODELS_CACHE = {}
+_MODELS_CACHE_LOCK = threading.Lock()
+
+def load_models():
+    """加载模型文件，结果缓存在进程内"""
+    # 获取程序运行目录
+    if getattr(sys, 'frozen', False):
+        # 如果是打包后的exe文件
+        base_path = Path(sys._MEIPASS)
+    else:
+        # 如果是源代码运行
+        base_path = Path(__file__).parent.parent
+    
+    models_path = base_path / "models" / "pipelines_by_target.pkl"
+    with _MODELS_CACHE_LOCK:
+        if models_path not in _MODELS_CACHE:
+            # 延迟导入joblib，缩短窗口显示前的等待时间
+            import joblib
+            # 以内存映射方式加载模型中的numpy数组，按需分页读入，降低启动I/O和内存占用
+            _MODELS_CACHE[models_path] = joblib.load(models_path, mmap_mode='r')
+        return _MODELS_CACHE[models_path]
 
 class PredictionApp:
+    # 缩放后的logo图像缓存，重复创建窗口时无需再次解码和缩放
+    _logo_cache = {}
+    
     def __init__(self, root):
         self.root = root
         self.root.title("氯碱工业理化常数计算软件V1.0")
         self.root.geometry("780x500")  # 更紧凑的窗口尺寸，适合笔记本电脑
         self.root.resizable(True, True)
-        self.root.configure(bg="#f0f0f0")  # 设置窗口背景色
         
-        # 加载模型
+        self.models = None
+        
+        # 后台计算结果队列 (工作线程 -> Tk主线程)
+        self._result_q = queue.Queue()
+        self._computing = False
+        self._spinner_step = 0
+        self._spinner_job = None  # 待执行的加载动画回调id，计算结束时取消
+        
+        # 先显示界面，模型在后台线程中加载，加载完成前禁用计算和公式按钮
+        self.setup_ui()
+        self.predict_btn.config(state="disabled")
+        self.formula_btn.config(state="disabled")
+        self._set_result_text("正在加载模型...\n")
+        
+        self._load_error = None
+        self._models_loaded = threading.Event()
+        self._warmup_done = threading.Event()
+        threading.Thread(target=self._load_models, daemon=True).start()
+        self.root.after(50, self._poll_models_loaded)
+    
+    @classmethod
+    def warm(cls):
+        """预先加载模型 (不创建界面)，可在创建Tk窗口的同时于后台线程调用"""
         try:
-            # 获取程序运行目录
-            if getattr(sys, 'frozen', False):
-                # 如果是打包后的exe文件
-                base_path = Path(sys._MEIPASS)
-            else:
-                # 如果是源代码运行
-                base_path = Path(__file__).parent.parent
-            
-            models_path = base_path / "models" / "pipelines_by_target.pkl"
-            self.models = joblib.load(models_path)
+            load_models()
+        except Exception:
+            pass  # 加载失败时由窗口再次加载并提示错误
+    
+    def _load_models(self):
+        """后台线程: 加载并索引模型，随后预热 (不得访问任何Tk控件)"""
+        try:
+            self.models = load_models()
+            self._index_models()
         except Exception as e:
-            messagebox.showerror("错误", f"加载模型失败：{str(e)}")
+            self._load_error = e
+            self._warmup_done.set()
+            return
+        finally:
+            self._models_loaded.set()
+        
+        # 预热模型，首次计算不再承担初始化开销
+        self._warmup_models()
+    
+    def _poll_models_loaded(self):
+        """主线程轮询模型加载状态"""
+        if not self._models_loaded.is_set():
+            self.root.after(50, self._poll_models_loaded)
+            return
+        
+        if self._load_error is not None:
+            messagebox.showerror("错误", f"加载模型失败：{str(self._load_error)}")
             self.root.destroy()
             return
         
-        self.setup_ui()
+        self._on_models_ready()
     
-    def convert_pressure_to_bar(self, pressure_value, unit):
-        """将不同单位的压力转换为bar.A"""
-        if unit == "bar.A":
-            return pressure_value
-        elif unit == "kPa.A":
-            return pressure_value / 100  # 1 bar = 100 kPa
-        elif unit == "MPa.A":
-            return pressure_value * 10   # 1 MPa = 10 bar
-        elif unit == "kg/cm2.A":
-            return pressure_value * 0.980665  # 1 kg/cm2 = 0.980665 bar
-        else:
-            return pressure_value
+    def _on_models_ready(self):
+        """模型加载完成后启用操作按钮"""
+        self._set_result_text()
+        self.predict_btn.config(state="normal")
+        self.formula_btn.config(state="normal")
+    
+    def _index_models(self):
+        """加载后为每个模型生成元数据并按溶液类型分组，避免每次计算时重复扫描模型列表"""
+        self._model_meta = {}
+        self._models_by_solution = {}
+        self._has_concentration = {}
+        self._sample_buffers = {}
+        for stem, model_data in self.models.items():
+            kind = classify_model(stem)
+            expected = _KIND_FEATURES[kind]
+            # 兼容旧版本模型格式 (未保存特征列表，按输入顺序处理)
+            if isinstance(model_data, dict):
+                pipe = model_data["model"]
+                features = tuple(model_data["features"])
+            else:
+                pipe = model_data
+                features = expected
+            
+            # 输入样本按固定位置填充，特征顺序不一致时拒绝加载，避免静默给出错误结果
+            if features != expected:
+                raise ValueError(f"模型 {stem} 的特征顺序 {list(features)} 与界面输入顺序 {list(expected)} 不一致")
+            
+            display_name = self.format_property_name(stem)
+            solution = stem.split("_", 1)[0]
+            meta = ModelMeta(stem=stem,
+                             display_name=display_name,
+                             property_name=display_name.replace(f"{solution} ", "").replace(solution, "").strip(),
+                             unit=self._get_property_unit(stem),
+                             kind=kind,
+                             feature_cols=features,
+                             pipe=pipe,
+                             is_vapor_pressure="vapor_pressure" in stem)
+            self._model_meta[stem] = meta
+            
+            # 每类模型预分配一个1行输入缓冲区，计算时原地填充
+            self._sample_buffers.setdefault(meta.kind, np.empty((1, len(features)), dtype=np.float64))
+            
+            # 拆分预处理与回归器，预处理参数相同的管道在计算时共用一次变换
+            steps = getattr(pipe, 'named_steps', {})
+            if steps:
+                meta.preprocess = pipe[:-1]
+                meta.regressor = pipe.steps[-1][1]
+                meta.prep_key = preprocessing_key(pipe)
+            
+            # 多项式模型: 预先展开公式系数，显示公式时直接读取；并构建融合求值函数
+            if 'poly' in steps:
+                scaler = steps.get('scale', steps.get('scaler'))
+                try:
+                    meta.expanded_coeffs = expand_polynomial_coefficients(scaler, steps['poly'], steps['reg'])
+                except Exception:
+                    meta.expanded_coeffs = None
+                try:
+                    meta.fast_eval = self._build_fast_eval(meta, scaler)
+                except Exception:
+                    meta.fast_eval = None
+            
+            # 模型名称以溶液类型开头 (如 NaOH_density)
+            if solution in _SOLUTION_TYPES:
+                self._models_by_solution.setdefault(solution, []).append(meta)
+        
+        # 每种溶液类型都有条目 (没有模型时为空列表/False)，计算时直接取值
+        for solution in _SOLUTION_TYPES:
+            metas = self._models_by_solution.setdefault(solution, [])
+            self._has_concentration[solution] = any(meta.kind == "concentration" for meta in metas)
+        
+        # 各类模型的输入样本构建方法 (填充对应的预分配缓冲区)
+        self._sample_builders = {
+            "bubblepoint": self._bubblepoint_sample,
+            "concentration": self._concentration_sample,
+            "hcl_vapor": self._hcl_vapor_sample,
+            "standard": self._standard_sample,
+        }
+    
+    def _build_fast_eval(self, meta, scaler):
+        """为多项式模型构建融合求值函数，结果与sklearn管道不一致时返回None"""
+        steps = meta.pipe.named_steps
+        fast_eval = make_polynomial_evaluator(scaler, steps['poly'], steps['reg'])
+        if fast_eval is None:
+            return None
+        
+        # 在训练数据分布范围内取点，与管道预测结果核对
+        n_features = len(scaler.mean_)
+        offsets = np.array([-1.5, -1.0, 0.0, 1.0, 1.5])
+        offsets = np.stack([np.roll(offsets, i) for i in range(n_features)], axis=1)
+        probe = scaler.mean_ + offsets * scaler.scale_
+        with _positional_features():
+            expected = meta.pipe.predict(probe)
+        actual = [fast_eval(*row) for row in probe.tolist()]
+        if not np.allclose(actual, expected, rtol=1e-9, atol=1e-9):
+            return None
+        return fast_eval
+    
+    def _warmup_models(self):
+        """对计算时仍走sklearn管道的模型预测一次，提前完成BLAS等一次性初始化
+        (多项式模型已在构建闭式求值函数时调用过管道，计算时也不再使用管道)"""
+        try:
+            with _positional_features():
+                for meta in self._model_meta.values():
+                    imputer = getattr(meta.pipe, 'named_steps', {}).get('imputer')
+                    if meta.fast_eval is not None or imputer is None:
+                        continue
+                    try:
+                        # 使用训练数据的中位数作为输入，保证处于模型的有效范围内
+                        meta.pipe.predict(np.asarray(imputer.statistics_, dtype=np.float64).reshape(1, -1))
+                    except Exception:
+                        pass  # 预热失败不影响正常计算
+        finally:
+            self._warmup_done.set()
     
     def format_property_name(self, stem):
         """格式化属性名称，保持正确的化学式大小写，并确保对齐"""
-        # 将下划线转为空格并首字母大写
+        # 将下划线转为空格并首字母大写，再一次性完成所有修正
         formatted = stem.replace("_", " ").title()
-        
-        # 修正化学式的大小写
-        formatted = formatted.replace("Naoh", "NaOH")
-        formatted = formatted.replace("Nacl", "NaCl")
-        formatted = formatted.replace("Hcl", "HCl")
-        
-        # 修正术语
-        formatted = formatted.replace("Bubblepoint", "Bubble Point Temperature")
-        
-        # 缩短长属性名以确保完美对齐 (最多22个字符)
-        formatted = formatted.replace("Thermal Conductivity", "Thermal Cond.")
-        formatted = formatted.replace("Bubble Point Temperature", "Bubble Point Temp")
-        formatted = formatted.replace("Vapor Pressure", "Vapor Press.")
-        
-        return formatted
-    
-    def convert_vapor_pressure_from_mmhg(self, pressure_mmhg, target_unit):
-        """将蒸汽压从mmHg转换为目标单位"""
-        if target_unit == "mmHg":
-            return pressure_mmhg
-        elif target_unit == "kPa":
-            return pressure_mmhg * 0.133322  # 1 mmHg = 0.133322 kPa
-        elif target_unit == "bar":
-            return pressure_mmhg * 0.00133322  # 1 mmHg = 0.00133322 bar
-        elif target_unit == "atm":
-            return pressure_mmhg * 0.00131579  # 1 mmHg = 0.00131579 atm
-        elif target_unit == "psi":
-            return pressure_mmhg * 0.0193368  # 1 mmHg = 0.0193368 psi
-        elif target_unit == "torr":
-            return pressure_mmhg * 1.0  # 1 mmHg = 1 torr
-        else:
-            return pressure_mmhg
+        return _PROPERTY_NAME_RE.sub(lambda m: _PROPERTY_NAME_REPLACEMENTS[m.group(0)], formatted)
     
     def setup_ui(self):
         """设置主界面"""
@@ -106,16 +531,31 @@ class PredictionApp:
             else:
                 base_path = Path(__file__).parent.parent
             
+            # 优先使用预先缩放好的logo (fig/logo_45.png，由logo.jpg按高度45像素缩放生成)，
+            # Tk可直接读取PNG，无需导入PIL和运行时缩放
+            sized_logo_path = base_path / "fig" / "logo_45.png"
             logo_path = base_path / "fig" / "logo.jpg"
-            if logo_path.exists():
+            if sized_logo_path.exists():
+                self.logo_photo = tk.PhotoImage(file=str(sized_logo_path))
+            elif logo_path.exists():
+                # 延迟导入PIL，缩短程序启动时间
+                from PIL import Image, ImageTk
                 logo_image = Image.open(logo_path)
                 original_width, original_height = logo_image.size
                 target_height = 45  # 减小logo尺寸以节省空间
                 aspect_ratio = original_width / original_height
                 target_width = int(target_height * aspect_ratio)
-                logo_image = logo_image.resize((target_width, target_height), Image.Resampling.LANCZOS)
-                self.logo_photo = ImageTk.PhotoImage(logo_image)
                 
+                cache_key = (target_width, target_height)
+                if cache_key not in PredictionApp._logo_cache:
+                    # 小尺寸缩略图使用BILINEAR即可，画质差异不可见且速度快得多
+                    PredictionApp._logo_cache[cache_key] = logo_image.resize(cache_key, Image.Resampling.BILINEAR)
+                # PhotoImage绑定到当前Tk解释器，因此每个窗口单独创建
+                self.logo_photo = ImageTk.PhotoImage(PredictionApp._logo_cache[cache_key])
+            else:
+                self.logo_photo = None
+            
+            if self.logo_photo is not None:
                 logo_label = tk.Label(header_frame, image=self.logo_photo, bg="#f8f9fa")
                 logo_label.pack(pady=2)
         except Exception as e:
@@ -130,6 +570,7 @@ class PredictionApp:
         # 创建现代化容器 - Apple风格紧凑布局
         main_container = tk.Frame(self.root, bg="#f8f9fa")
         main_container.pack(fill="both", expand=True, padx=16, pady=(0, 8))
+        self._main_container = main_container  # 供结果区域使用
         
         # 输入参数卡片 - 减少内边距
         input_card = tk.Frame(main_container, bg="white", relief="flat", bd=0)
@@ -155,7 +596,7 @@ class PredictionApp:
                                  font=("Segoe UI", 9), bg="white", fg="#2c2c2c")
         solution_label.grid(row=0, column=0, sticky="w", pady=4)
         self.solution_type_var = tk.StringVar(value="NaOH")
-        solution_types = ["NaOH", "NaCl", "HCl"]
+        solution_types = list(_SOLUTION_TYPES)
         self.solution_type_combo = ttk.Combobox(input_frame, textvariable=self.solution_type_var,
                                               values=solution_types, width=11, state="readonly",
                                               font=("Segoe UI", 9))
@@ -206,27 +647,32 @@ class PredictionApp:
         
         # 压力单位下拉菜单
         self.pressure_unit_var = tk.StringVar(value="bar.A")
-        pressure_units = ["bar.A", "kPa.A", "MPa.A", "kg/cm2.A"]
+        pressure_units = list(_PRESSURE_TO_BAR)
         self.pressure_unit_combo = ttk.Combobox(pressure_frame, textvariable=self.pressure_unit_var,
                                               values=pressure_units, width=5, state="readonly",
                                               font=("Segoe UI", 8))
         self.pressure_unit_combo.pack(side="left", padx=(2, 0))
+        # 选择单位时即换算出系数，计算时只需一次乘法
+        self.pressure_unit_combo.bind("<<ComboboxSelected>>", self.on_pressure_unit_change)
+        self.on_pressure_unit_change()
         
         # 蒸汽压结果单位选择
         vapor_label = tk.Label(input_frame, text="蒸汽压单位:", 
                               font=("Segoe UI", 9), bg="white", fg="#2c2c2c")
         vapor_label.grid(row=2, column=2, sticky="w", pady=4)
         self.vapor_pressure_unit_var = tk.StringVar(value="mmHg")
-        vapor_pressure_units = ["mmHg", "kPa", "bar", "atm", "psi", "torr"]
+        vapor_pressure_units = list(_MMHG_TO)
         self.vapor_pressure_unit_combo = ttk.Combobox(input_frame, textvariable=self.vapor_pressure_unit_var,
                                                     values=vapor_pressure_units, width=11, state="readonly",
                                                     font=("Segoe UI", 9))
         self.vapor_pressure_unit_combo.grid(row=2, column=3, pady=4, padx=(6, 0))
+        self.vapor_pressure_unit_combo.bind("<<ComboboxSelected>>", self.on_vapor_pressure_unit_change)
+        self.on_vapor_pressure_unit_change()
     
     def _setup_result_section(self):
         """设置结果显示区域和操作按钮 - Apple风格横向布局"""
         # 获取主容器
-        main_container = self.root.children[list(self.root.children.keys())[-1]]
+        main_container = self._main_container
         
         # Apple风格控制面板 - 按钮和结果在同一行
         control_panel = tk.Frame(main_container, bg="white", relief="flat", bd=0)
@@ -244,20 +690,20 @@ class PredictionApp:
         control_title.pack(anchor="w", pady=(0, 8))
         
         # 现代化紧凑按钮
-        predict_btn = tk.Button(control_left, text="🚀 开始计算", command=self.predict,
-                              font=("Segoe UI", 10, "bold"), 
-                              bg="#007aff", fg="white",
-                              relief="flat", bd=0, padx=20, pady=8,
-                              cursor="hand2", activebackground="#0056b3")
-        predict_btn.pack(fill="x", pady=(0, 6))
+        self.predict_btn = tk.Button(control_left, text="🚀 开始计算", command=self.predict,
+                                     font=("Segoe UI", 10, "bold"), 
+                                     bg="#007aff", fg="white",
+                                     relief="flat", bd=0, padx=20, pady=8,
+                                     cursor="hand2", activebackground="#0056b3")
+        self.predict_btn.pack(fill="x", pady=(0, 6))
         
         # 公式按钮
-        formula_btn = tk.Button(control_left, text="📊 显示公式", command=self.show_formula_selector,
-                               font=("Segoe UI", 10), 
-                               bg="white", fg="#007aff",
-                               relief="solid", bd=1, padx=20, pady=8,
-                               cursor="hand2", activebackground="#f0f0f0")
-        formula_btn.pack(fill="x")
+        self.formula_btn = tk.Button(control_left, text="📊 显示公式", command=self.show_formula_selector,
+                                     font=("Segoe UI", 10), 
+                                     bg="white", fg="#007aff",
+                                     relief="solid", bd=1, padx=20, pady=8,
+                                     cursor="hand2", activebackground="#f0f0f0")
+        self.formula_btn.pack(fill="x")
         
         # 右侧结果区域
         result_right = tk.Frame(control_panel, bg="white")
@@ -288,22 +734,37 @@ class PredictionApp:
         scrollbar.pack(side="right", fill="y")
         
         # 配置现代化文本样式
-        self.result_text.tag_configure("header", font=("Segoe UI", 11, "bold"), foreground="#1d1d1f")
-        self.result_text.tag_configure("separator")
-        self.result_text.tag_configure("property", font=("Segoe UI", 10), foreground="#2c2c2c")
-        self.result_text.tag_configure("value", font=("Segoe UI", 10, "bold"), foreground="#007aff")
-        self.result_text.tag_configure("unit", font=("Segoe UI", 10), foreground="#666666")
-        self.result_text.tag_configure("skip", font=("Segoe UI", 10, "italic"), foreground="#999999")
+        text_styles = (
+            ("header", {"font": ("Segoe UI", 11, "bold"), "foreground": "#1d1d1f"}),
+            ("separator", {}),
+            ("property", {"font": ("Segoe UI", 10), "foreground": "#2c2c2c"}),
+            ("value", {"font": ("Segoe UI", 10, "bold"), "foreground": "#007aff"}),
+            ("unit", {"font": ("Segoe UI", 10), "foreground": "#666666"}),
+            ("skip", {"font": ("Segoe UI", 10, "italic"), "foreground": "#999999"}),
+        )
+        tag_configure = self.result_text.tag_configure
+        for tag, options in text_styles:
+            tag_configure(tag, **options)
     
     def _validate_and_prepare_inputs(self):
         """验证输入并准备计算所需的数据"""
         try:
-            # 获取输入值
-            x1 = float(self.x1_var.get()) if self.x1_var.get() else None
-            x2 = float(self.x2_var.get()) if self.x2_var.get() else None
-            x3 = float(self.x3_var.get()) if self.x3_var.get() else None
-            x4 = float(self.x4_var.get()) if self.x4_var.get() else None
+            # 获取输入值 - 每个Tk变量只读取一次 (且只在主线程读取)
+            raw1 = self.x1_var.get()
+            raw2 = self.x2_var.get()
+            raw3 = self.x3_var.get()
+            raw4 = self.x4_var.get()
             solution_type = self.solution_type_var.get()
+            pressure_factor = self._pressure_factor
+            
+            x1 = float(raw1) if raw1 else None
+            x2 = float(raw2) if raw2 else None
+            x3 = float(raw3) if raw3 else None
+            x4 = float(raw4) if raw4 else None
+            
+            # float()可解析"nan"/"inf"，这类值会绕过范围检查并使模型输出nan，视为无效输入
+            if any(x is not None and not math.isfinite(x) for x in (x1, x2, x3, x4)):
+                return None, "请输入有效的数值"
             
             # 输入验证
             validation_errors = self.validate_inputs(x1, x2, x3, x4, solution_type)
@@ -311,113 +772,120 @@ class PredictionApp:
                 return None, f"输入验证失败:\n" + "\n".join(f"  {error}" for error in validation_errors)
             
             # 验证必要输入 (根据模型类型不同)
-            has_concentration_model = any("concentration" in stem for stem in self.models.keys() if solution_type in stem)
+            has_concentration_model = self._has_concentration.get(solution_type, False)
             if not has_concentration_model and x1 is None:
                 return None, "浓度 (X1) 是必填项"
                 
-            return {"x1": x1, "x2": x2, "x3": x3, "x4": x4, "solution_type": solution_type}, None
+            return {"x1": x1, "x2": x2, "x3": x3, "x4": x4, "solution_type": solution_type,
+                    "pressure_factor": pressure_factor}, None
             
         except ValueError:
             return None, "请输入有效的数值"
     
     def _run_model_predictions(self, inputs):
         """运行模型预测计算"""
-        x1, x2, x3, x4, solution_type = inputs["x1"], inputs["x2"], inputs["x3"], inputs["x4"], inputs["solution_type"]
-        
-        # 获取当前溶液类型的模型
-        filtered_models = {k: v for k, v in self.models.items() if solution_type in k}
         predictions = {}
+        # 同类模型的输入特征相同，共用一个样本
+        # (预分配缓冲区可安全复用: 计算期间按钮已禁用，同一时间只有一个工作线程)
+        samples = {}
+        transformed = {}
         
-        for stem, model_data in filtered_models.items():
-            # 兼容旧版本模型格式
-            if isinstance(model_data, dict):
-                pipe = model_data["model"]
-                features = model_data["features"]
-            else:
-                pipe = model_data
-                features = ["X1", "X2"]
-            
+        # 获取当前溶液类型的模型
+        for meta in self._models_by_solution.get(inputs["solution_type"], []):
             # 根据模型所需特征创建输入样本
-            sample = self._create_model_sample(stem, x1, x2, x3, x4)
+            if meta.kind not in samples:
+                samples[meta.kind] = self._sample_builders[meta.kind](inputs, self._sample_buffers[meta.kind])
+            sample = samples[meta.kind]
             if sample is None:
                 continue  # 跳过无法创建样本的模型
                 
-            # 执行预测
-            prediction = pipe.predict(sample)[0]
-            predictions[stem] = prediction
+            # 执行预测 - 多项式模型直接闭式求值，其余模型调用sklearn管道
+            if meta.fast_eval is not None:
+                predictions[meta.stem] = meta.fast_eval(*sample[0].tolist())
+            elif meta.preprocess is not None:
+                # 预处理参数相同的管道只做一次特征变换，再分别调用各自的回归器
+                key = (meta.kind, meta.prep_key)
+                with _positional_features():
+                    if key not in transformed:
+                        transformed[key] = meta.preprocess.transform(sample)
+                    predictions[meta.stem] = meta.regressor.predict(transformed[key])[0]
+            else:
+                with _positional_features():
+                    predictions[meta.stem] = meta.pipe.predict(sample)[0]
             
         return predictions
     
-    def _create_model_sample(self, stem, x1, x2, x3, x4):
-        """根据模型类型创建输入样本"""
-        if "bubblepoint" in stem:
-            if x3 is None:
-                return None
-            pressure_unit = self.pressure_unit_var.get()
-            x3_bar = self.convert_pressure_to_bar(x3, pressure_unit)
-            return pd.DataFrame({"X1": [x1], "X3": [x3_bar]})
-            
-        elif "concentration" in stem:
-            if x2 is None or x4 is None:
-                return None
-            return pd.DataFrame({"X2": [x2], "X4": [x4]})
-            
-        elif "HCl" in stem and "vapor_pressure" in stem:
-            if x2 is None:
-                return None
-            # Create advanced features for Neural Network
-            import numpy as np
-            T_K = x2 + 273.15
-            feature_dict = {
-                'X1': [x1], 'X2': [x2], 'inv_T': [1 / T_K], 'log_T': [np.log(T_K)], 'sqrt_T': [np.sqrt(T_K)],
-                'log_X1': [np.log(x1 + 1)], 'sqrt_X1': [np.sqrt(x1)], 'X1_squared': [x1 ** 2],
-                'X1_inv_T': [x1 * (1 / T_K)], 'X1_log_T': [x1 * np.log(T_K)], 'X1_sqrt_T': [x1 * np.sqrt(T_K)],
-                'X1_X2': [x1 * x2], 'X1_X2_inv_T': [x1 * x2 * (1 / T_K)],
-                'exp_inv_T': [np.exp(1 / T_K)], 'X1_exp_inv_T': [x1 * np.exp(1 / T_K)]
-            }
-            return pd.DataFrame(feature_dict)
-            
-        else:
-            # 标准模型使用浓度和温度
-            if x1 is None or x2 is None:
-                return None
-            return pd.DataFrame({"X1": [x1], "X2": [x2]})
+    def _bubblepoint_sample(self, inputs, sample):
+        """泡点模型: 浓度和压力 (压力换算为bar.A)"""
+        x1, x3 = inputs["x1"], inputs["x3"]
+        if x3 is None:
+            return None
+        sample[0, 0] = x1
+        sample[0, 1] = x3 * inputs["pressure_factor"]
+        return sample
+    
+    def _concentration_sample(self, inputs, sample):
+        """浓度模型: 温度和密度"""
+        x2, x4 = inputs["x2"], inputs["x4"]
+        if x2 is None or x4 is None:
+            return None
+        sample[0, 0] = x2
+        sample[0, 1] = x4
+        return sample
+    
+    def _hcl_vapor_sample(self, inputs, sample):
+        """HCl蒸气压神经网络: 15个工程特征 (顺序见 HCL_FEATURES，单行标量计算)"""
+        x1, x2 = inputs["x1"], inputs["x2"]
+        if x2 is None:
+            return None
+        fill_hcl_features_row(x1, x2, sample[0])
+        return sample
+    
+    def _standard_sample(self, inputs, sample):
+        """标准模型: 浓度和温度"""
+        x1, x2 = inputs["x1"], inputs["x2"]
+        if x1 is None or x2 is None:
+            return None
+        sample[0, 0] = x1
+        sample[0, 1] = x2
+        return sample
     
     def _format_and_display_results(self, predictions, solution_type):
-        """格式化并显示预测结果"""
-        self.result_text.delete(1.0, tk.END)
+        """格式化并显示预测结果 (拼接完整文本后一次性插入文本框)"""
         header_text = f"计算结果 ({solution_type}):\n"
-        self.result_text.insert(tk.END, header_text, "header")
         separator_line = "-" * 40 + "\n"
-        self.result_text.insert(tk.END, separator_line, "separator")
+        parts = [header_text, separator_line]
+        target_unit = self._vapor_pressure_unit
+        vapor_factor = self._vapor_pressure_factor
         
         for stem, prediction in predictions.items():
-            formatted_name = self.format_property_name(stem)
+            meta = self._model_meta[stem]
+            formatted_name = meta.display_name
             
-            # 处理蒸汽压单位转换
-            if "vapor_pressure" in stem:
-                target_unit = self.vapor_pressure_unit_var.get()
-                if target_unit != "mmHg":
-                    val = self.convert_vapor_pressure_from_mmhg(prediction, target_unit)
-                    unit = target_unit
-                else:
-                    val = prediction
-                    unit = "mmHg"
+            # 处理蒸汽压单位转换 (模型输出为mmHg)
+            if meta.is_vapor_pressure:
+                val = prediction * vapor_factor
+                unit = target_unit
                 # 完美对齐：固定宽度的属性名 + 冒号 + 右对齐的数值 + 单位
                 result_line = f"{formatted_name:<22} : {val:>10.4f} {unit}\n"
             else:
                 # 其他属性的单位处理 - 完美对齐
                 val = prediction
-                unit = self._get_property_unit(stem)
+                unit = meta.unit
                 if unit:
                     result_line = f"{formatted_name:<22} : {val:>10.4f} {unit}\n"
                 else:
                     result_line = f"{formatted_name:<22} : {val:>10.4f}\n"
                     
-            self.result_text.insert(tk.END, result_line)
+            parts.append(result_line)
         
         end_separator = "-" * 40 + "\n"
-        self.result_text.insert(tk.END, end_separator)
+        parts.append(end_separator)
+        
+        self._set_result_text("".join(parts))
+        # 标题占第1行，分隔线占第2行
+        self.result_text.tag_add("header", "1.0", "2.0")
+        self.result_text.tag_add("separator", "2.0", "3.0")
     
     def _get_property_unit(self, stem):
         """获取属性单位"""
@@ -446,67 +914,102 @@ class PredictionApp:
         else:  # HCl
             self.concentration_label.config(text="浓度 (%HCl):")
     
+    def on_pressure_unit_change(self, event=None):
+        """缓存压力单位到bar.A的换算系数"""
+        self._pressure_factor = _PRESSURE_TO_BAR.get(self.pressure_unit_var.get(), 1.0)
+    
+    def on_vapor_pressure_unit_change(self, event=None):
+        """缓存蒸汽压显示单位及其相对mmHg的换算系数"""
+        self._vapor_pressure_unit = self.vapor_pressure_unit_var.get()
+        self._vapor_pressure_factor = _MMHG_TO.get(self._vapor_pressure_unit, 1.0)
+    
     def validate_inputs(self, x1, x2, x3, x4, solution_type):
-        """验证输入值的合理性"""
-        errors = []
-        
-        # 浓度范围验证
-        if x1 is not None:
-            if x1 < 0 or x1 > 100:
-                errors.append("浓度应在 0-100% 之间")
-        
-        # 温度范围验证  
-        if x2 is not None:
-            if x2 < -50 or x2 > 500:
-                errors.append("温度应在 -50°C 到 500°C 之间")
-        
-        # 压力验证
-        if x3 is not None:
-            if x3 <= 0:
-                errors.append("压力必须为正值")
-        
-        # 密度验证
-        if x4 is not None:
-            if x4 <= 0 or x4 > 5000:
-                errors.append("密度应在 0-5000 kg/m³ 之间")
-        
-        return errors
+        """验证输入值的合理性 (一次数组比较检查全部输入，空输入跳过)"""
+        values = np.array([np.nan if x is None else x for x in (x1, x2, x3, x4)], dtype=np.float64)
+        # NaN参与比较结果均为False，因此未填写的输入不会报错
+        bad = (values < _INPUT_MIN) | (values <= _INPUT_MIN_EXCLUSIVE) | (values > _INPUT_MAX)
+        return [message for is_bad, message in zip(bad.tolist(), _INPUT_ERRORS) if is_bad]
 
     def predict(self):
-        """主预测方法 - 简化版本，使用辅助方法"""
+        """主预测方法 - 模型计算在后台线程中执行，避免界面卡顿"""
         try:
-            # 清空之前的结果并显示加载状态
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, "正在计算中...\n")
-            self.root.update()
-            
             # 验证输入并准备数据
             inputs, error = self._validate_and_prepare_inputs()
             if error:
-                self.result_text.delete(1.0, tk.END)
-                self.result_text.insert(tk.END, error)
+                self._set_result_text(error)
                 return
             
-            # 运行预测计算
-            predictions = self._run_model_predictions(inputs)
+            # 计算完成前禁用按钮防止重复提交；不立即显示"正在计算中"，
+            # 计算通常在毫秒内完成，结果框只刷新一次，超过100ms仍未完成时才显示加载动画
+            self.predict_btn.config(state="disabled")
+            self._computing = True
+            self._spinner_step = 0
             
-            # 格式化并显示结果
-            self._format_and_display_results(predictions, inputs["solution_type"])
+            # 在后台线程中运行预测计算，主循环负责轮询结果和刷新加载动画 (首次轮询尽快进行)
+            threading.Thread(target=self._prediction_worker, args=(inputs,), daemon=True).start()
+            self.root.after(5, self._poll_results, inputs)
+            self._spinner_job = self.root.after(100, self._tick_spinner)
             
         except ValueError:
             messagebox.showerror("输入错误", "请输入有效的数值")
         except Exception as e:
             messagebox.showerror("计算错误", f"计算过程中出现错误：{str(e)}")
     
+    def _prediction_worker(self, inputs):
+        """后台线程: 运行预测并将结果放入队列 (不得访问任何Tk控件)"""
+        self._warmup_done.wait()
+        try:
+            self._result_q.put(("ok", self._run_model_predictions(inputs)))
+        except Exception as e:
+            self._result_q.put(("error", e))
+    
+    def _poll_results(self, inputs):
+        """主线程轮询后台计算结果"""
+        try:
+            status, payload = self._result_q.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_results, inputs)
+            return
+        
+        self._computing = False
+        # 取消尚未触发的加载动画，避免快速再次点击时旧回调开启第二条动画链
+        if self._spinner_job is not None:
+            self.root.after_cancel(self._spinner_job)
+            self._spinner_job = None
+        self.predict_btn.config(state="normal")
+        if status == "error":
+            self._set_result_text()
+            messagebox.showerror("计算错误", f"计算过程中出现错误：{str(payload)}")
+            return
+        
+        # 格式化并显示结果
+        self._format_and_display_results(payload, inputs["solution_type"])
+    
+    def _set_result_text(self, text=""):
+        """用一次删除和一次插入替换结果框的全部内容"""
+        self.result_text.delete(1.0, tk.END)
+        if text:
+            self.result_text.insert(tk.END, text)
+    
+    def _tick_spinner(self):
+        """计算进行中时刷新加载提示动画"""
+        self._spinner_job = None
+        if not self._computing:
+            return
+        self._set_result_text("正在计算中" + "." * (self._spinner_step + 1) + "\n")
+        self._spinner_step = (self._spinner_step + 1) % 3
+        self._spinner_job = self.root.after(100, self._tick_spinner)
+    
     def extract_model_formula(self, model_name):
-        """提取指定模型的数学公式"""
+        """提取指定模型的数学公式 (结果缓存在模型元数据中)"""
+        meta = self._model_meta[model_name]
+        if meta.formula_info is None:
+            meta.formula_info = self._build_model_formula(meta.pipe, model_name)
+        return meta.formula_info
+    
+    def _build_model_formula(self, pipe, model_name):
+        """根据模型类型生成公式信息"""
         try:
-            model_data = self.models[model_name]
-            if isinstance(model_data, dict):
-                pipe = model_data["model"]
-            else:
-                pipe = model_data
-            
             # 检查模型类型 - 优先检查TransformedTargetRegressor (log-transformed models)
             if hasattr(pipe, 'named_steps'):
                 if hasattr(pipe.named_steps.get('reg'), 'regressor_'):
@@ -527,27 +1030,9 @@ class PredictionApp:
             return f"无法提取公式: {str(e)}"
     
     def extract_polynomial_formula(self, pipe, model_name):
-        """提取多项式回归公式 - 支持动态度数"""
+        """提取多项式回归公式 - 支持动态度数 (系数已在加载模型时展开)"""
         try:
-            # Check for different step names (scale vs scaler)
-            if 'scale' in pipe.named_steps:
-                scaler = pipe.named_steps['scale']
-            else:
-                scaler = pipe.named_steps['scaler']
-            poly = pipe.named_steps['poly']
-            regressor = pipe.named_steps['reg']
-            
-            # 处理TransformedTargetRegressor
-            if hasattr(regressor, 'regressor_'):
-                actual_regressor = regressor.regressor_
-            else:
-                actual_regressor = regressor
-            
-            scale_mean = scaler.mean_
-            scale_std = scaler.scale_
-            coefficients = actual_regressor.coef_
-            intercept = actual_regressor.intercept_
-            degree = poly.degree
+            degree = pipe.named_steps['poly'].degree
             
             # 获取变量名称
             if "bubblepoint" in model_name:
@@ -558,144 +1043,11 @@ class PredictionApp:
                 var_names = ["X1 (浓度%)", "X2 (温度°C)"]
             
             # 获取单位
-            if "density" in model_name:
-                unit = "kg/m³"
-            elif "viscosity" in model_name:
-                unit = "cp"
-            elif "vapor_pressure" in model_name:
-                unit = "kPa"
-            elif "enthalpy" in model_name:
-                unit = "kcal/kgNaOH"
-            elif "bubblepoint" in model_name:
-                unit = "°C"
-            elif "concentration" in model_name:
-                unit = "g/L"
-            elif "thermal_conductivity" in model_name:
-                unit = "kcal/m.hr.°C"
-            else:
-                unit = ""
+            unit = self.get_unit_for_property(model_name)
             
-            # 计算展开后的系数 - 动态适应度数
-            if len(scale_mean) == 2:
-                mean1, mean2 = scale_mean[0], scale_mean[1]
-                std1, std2 = scale_std[0], scale_std[1]
-                
-                # 获取特征名称以正确映射系数
-                feature_names = poly.get_feature_names_out(['X1', 'X2'])
-                
-                # 构建系数映射
-                coeff_map = {}
-                for i, feature_name in enumerate(feature_names):
-                    if i < len(coefficients):
-                        coeff_map[feature_name] = coefficients[i]
-                
-                # 计算展开的系数
-                expanded_coeffs = {}
-                
-                # 常数项
-                expanded_coeffs['constant'] = intercept
-                
-                # 一次项系数
-                expanded_coeffs['X1'] = 0
-                expanded_coeffs['X2'] = 0
-                
-                # 二次项系数  
-                expanded_coeffs['X1^2'] = 0
-                expanded_coeffs['X1*X2'] = 0
-                expanded_coeffs['X2^2'] = 0
-                
-                # 三次项系数（如果适用）
-                if degree >= 3:
-                    expanded_coeffs['X1^3'] = 0
-                    expanded_coeffs['X1^2*X2'] = 0
-                    expanded_coeffs['X1*X2^2'] = 0
-                    expanded_coeffs['X2^3'] = 0
-                
-                # 展开标准化变换的影响
-                for feature_name, coeff in coeff_map.items():
-                    if feature_name == 'X1':
-                        expanded_coeffs['constant'] -= coeff * mean1 / std1
-                        expanded_coeffs['X1'] += coeff / std1
-                    elif feature_name == 'X2':
-                        expanded_coeffs['constant'] -= coeff * mean2 / std2
-                        expanded_coeffs['X2'] += coeff / std2
-                    elif feature_name == 'X1^2':
-                        expanded_coeffs['constant'] += coeff * (mean1**2) / (std1**2)
-                        expanded_coeffs['X1'] -= coeff * 2 * mean1 / (std1**2)
-                        expanded_coeffs['X1^2'] += coeff / (std1**2)
-                    elif feature_name == 'X1 X2':
-                        expanded_coeffs['constant'] += coeff * mean1 * mean2 / (std1 * std2)
-                        expanded_coeffs['X1'] -= coeff * mean2 / (std1 * std2)
-                        expanded_coeffs['X2'] -= coeff * mean1 / (std1 * std2)
-                        expanded_coeffs['X1*X2'] += coeff / (std1 * std2)
-                    elif feature_name == 'X2^2':
-                        expanded_coeffs['constant'] += coeff * (mean2**2) / (std2**2)
-                        expanded_coeffs['X2'] -= coeff * 2 * mean2 / (std2**2)
-                        expanded_coeffs['X2^2'] += coeff / (std2**2)
-                    elif degree >= 3:
-                        # 三次项展开
-                        if feature_name == 'X1^3':
-                            expanded_coeffs['constant'] -= coeff * (mean1**3) / (std1**3)
-                            expanded_coeffs['X1'] += coeff * 3 * (mean1**2) / (std1**3)
-                            expanded_coeffs['X1^2'] -= coeff * 3 * mean1 / (std1**3)
-                            expanded_coeffs['X1^3'] += coeff / (std1**3)
-                        elif feature_name == 'X1^2 X2':
-                            expanded_coeffs['constant'] -= coeff * (mean1**2) * mean2 / (std1**2 * std2)
-                            expanded_coeffs['X1'] += coeff * 2 * mean1 * mean2 / (std1**2 * std2)
-                            expanded_coeffs['X2'] += coeff * (mean1**2) / (std1**2 * std2)
-                            expanded_coeffs['X1^2'] -= coeff * mean2 / (std1**2 * std2)
-                            expanded_coeffs['X1*X2'] -= coeff * 2 * mean1 / (std1**2 * std2)
-                            expanded_coeffs['X1^2*X2'] += coeff / (std1**2 * std2)
-                        elif feature_name == 'X1 X2^2':
-                            expanded_coeffs['constant'] -= coeff * mean1 * (mean2**2) / (std1 * std2**2)
-                            expanded_coeffs['X1'] += coeff * (mean2**2) / (std1 * std2**2)
-                            expanded_coeffs['X2'] += coeff * mean1 * 2 * mean2 / (std1 * std2**2)
-                            expanded_coeffs['X1*X2'] -= coeff * 2 * mean2 / (std1 * std2**2)
-                            expanded_coeffs['X2^2'] -= coeff * mean1 / (std1 * std2**2)
-                            expanded_coeffs['X1*X2^2'] += coeff / (std1 * std2**2)
-                        elif feature_name == 'X2^3':
-                            expanded_coeffs['constant'] -= coeff * (mean2**3) / (std2**3)
-                            expanded_coeffs['X2'] += coeff * 3 * (mean2**2) / (std2**3)
-                            expanded_coeffs['X2^2'] -= coeff * 3 * mean2 / (std2**3)
-                            expanded_coeffs['X2^3'] += coeff / (std2**3)
-                
-                # 构建公式字符串 - 使用更高精度
-                formula_terms = []
-                
-                # 常数项
-                formula_terms.append(f"{expanded_coeffs['constant']:.12f}")
-                
-                # 添加各项（如果系数足够大）
-                threshold = 1e-12
-                
-                if abs(expanded_coeffs['X1']) > threshold:
-                    formula_terms.append(f"{expanded_coeffs['X1']:.12f}*X1")
-                if abs(expanded_coeffs['X2']) > threshold:
-                    formula_terms.append(f"{expanded_coeffs['X2']:.12f}*X2")
-                if abs(expanded_coeffs['X1^2']) > threshold:
-                    formula_terms.append(f"{expanded_coeffs['X1^2']:.12f}*X1^2")
-                if abs(expanded_coeffs['X1*X2']) > threshold:
-                    formula_terms.append(f"{expanded_coeffs['X1*X2']:.12f}*X1*X2")
-                if abs(expanded_coeffs['X2^2']) > threshold:
-                    formula_terms.append(f"{expanded_coeffs['X2^2']:.12f}*X2^2")
-                    
-                if degree >= 3:
-                    if abs(expanded_coeffs['X1^3']) > threshold:
-                        formula_terms.append(f"{expanded_coeffs['X1^3']:.12f}*X1^3")
-                    if abs(expanded_coeffs['X1^2*X2']) > threshold:
-                        formula_terms.append(f"{expanded_coeffs['X1^2*X2']:.12f}*X1^2*X2")
-                    if abs(expanded_coeffs['X1*X2^2']) > threshold:
-                        formula_terms.append(f"{expanded_coeffs['X1*X2^2']:.12f}*X1*X2^2")
-                    if abs(expanded_coeffs['X2^3']) > threshold:
-                        formula_terms.append(f"{expanded_coeffs['X2^3']:.12f}*X2^3")
-                
-                # 组合公式
-                formula = f"Y = {formula_terms[0]}"  # 常数项
-                for term in formula_terms[1:]:
-                    if term.startswith('-'):
-                        formula += f" - {term[1:]}"  # 负号已经在项中
-                    else:
-                        formula += f" + {term}"
+            expanded_coeffs = self._model_meta[model_name].expanded_coeffs
+            if expanded_coeffs is not None:
+                formula = f"Y = {format_polynomial(expanded_coeffs, degree)}"
                 
                 return {
                     'formula': formula,
@@ -771,11 +1123,8 @@ class PredictionApp:
             return f"提取神经网络公式时出错: {str(e)}"
     
     def extract_log_transformed_formula(self, pipe, model_name):
-        """提取对数变换模型的公式"""
+        """提取对数变换模型的公式 (系数已在加载模型时展开)"""
         try:
-            # 获取TransformedTargetRegressor的内部回归器
-            inner_regressor = pipe.named_steps['reg'].regressor_
-            
             # 获取多项式特征和标准化器
             poly = pipe.named_steps.get('poly')
             scaler = pipe.named_steps.get('scale')
@@ -789,154 +1138,14 @@ class PredictionApp:
                     'note': '此模型使用对数变换，公式较为复杂'
                 }
             
-            # 获取系数和截距
-            coefficients = inner_regressor.coef_
-            intercept = inner_regressor.intercept_
             degree = poly.degree
             
-            # 获取标准化参数
-            scale_mean = scaler.mean_
-            scale_std = scaler.scale_
-            
             # 获取单位
-            if "density" in model_name:
-                unit = "kg/m³"
-            elif "viscosity" in model_name:
-                unit = "cp"
-            elif "vapor_pressure" in model_name:
-                unit = "kPa"
-            elif "enthalpy" in model_name:
-                unit = "kcal/kgNaOH"
-            elif "bubblepoint" in model_name:
-                unit = "°C"
-            elif "concentration" in model_name:
-                unit = "g/L"
-            elif "thermal_conductivity" in model_name:
-                unit = "kcal/m.hr.°C"
-            else:
-                unit = ""
+            unit = self.get_unit_for_property(model_name)
             
-            # 提取多项式公式（与普通多项式相同的逻辑）
-            if len(scale_mean) == 2:
-                mean1, mean2 = scale_mean[0], scale_mean[1]
-                std1, std2 = scale_std[0], scale_std[1]
-                
-                # 获取特征名称以正确映射系数
-                feature_names = poly.get_feature_names_out(['X1', 'X2'])
-                
-                # 构建系数映射
-                coeff_map = {}
-                for i, feature_name in enumerate(feature_names):
-                    if i < len(coefficients):
-                        coeff_map[feature_name] = coefficients[i]
-                
-                # 计算展开的系数
-                expanded_coeffs = {}
-                
-                # 常数项
-                expanded_coeffs['constant'] = intercept
-                
-                # 一次项系数
-                expanded_coeffs['X1'] = 0
-                expanded_coeffs['X2'] = 0
-                
-                # 二次项系数  
-                expanded_coeffs['X1^2'] = 0
-                expanded_coeffs['X1*X2'] = 0
-                expanded_coeffs['X2^2'] = 0
-                
-                # 三次项系数（如果适用）
-                if degree >= 3:
-                    expanded_coeffs['X1^3'] = 0
-                    expanded_coeffs['X1^2*X2'] = 0
-                    expanded_coeffs['X1*X2^2'] = 0
-                    expanded_coeffs['X2^3'] = 0
-                
-                # 展开标准化变换的影响
-                for feature_name, coeff in coeff_map.items():
-                    if feature_name == 'X1':
-                        expanded_coeffs['constant'] -= coeff * mean1 / std1
-                        expanded_coeffs['X1'] += coeff / std1
-                    elif feature_name == 'X2':
-                        expanded_coeffs['constant'] -= coeff * mean2 / std2
-                        expanded_coeffs['X2'] += coeff / std2
-                    elif feature_name == 'X1^2':
-                        expanded_coeffs['constant'] += coeff * (mean1**2) / (std1**2)
-                        expanded_coeffs['X1'] -= coeff * 2 * mean1 / (std1**2)
-                        expanded_coeffs['X1^2'] += coeff / (std1**2)
-                    elif feature_name == 'X1 X2':
-                        expanded_coeffs['constant'] += coeff * mean1 * mean2 / (std1 * std2)
-                        expanded_coeffs['X1'] -= coeff * mean2 / (std1 * std2)
-                        expanded_coeffs['X2'] -= coeff * mean1 / (std1 * std2)
-                        expanded_coeffs['X1*X2'] += coeff / (std1 * std2)
-                    elif feature_name == 'X2^2':
-                        expanded_coeffs['constant'] += coeff * (mean2**2) / (std2**2)
-                        expanded_coeffs['X2'] -= coeff * 2 * mean2 / (std2**2)
-                        expanded_coeffs['X2^2'] += coeff / (std2**2)
-                    elif degree >= 3:
-                        # 三次项展开
-                        if feature_name == 'X1^3':
-                            expanded_coeffs['constant'] -= coeff * (mean1**3) / (std1**3)
-                            expanded_coeffs['X1'] += coeff * 3 * (mean1**2) / (std1**3)
-                            expanded_coeffs['X1^2'] -= coeff * 3 * mean1 / (std1**3)
-                            expanded_coeffs['X1^3'] += coeff / (std1**3)
-                        elif feature_name == 'X1^2 X2':
-                            expanded_coeffs['constant'] -= coeff * (mean1**2) * mean2 / (std1**2 * std2)
-                            expanded_coeffs['X1'] += coeff * 2 * mean1 * mean2 / (std1**2 * std2)
-                            expanded_coeffs['X2'] += coeff * (mean1**2) / (std1**2 * std2)
-                            expanded_coeffs['X1^2'] -= coeff * mean2 / (std1**2 * std2)
-                            expanded_coeffs['X1*X2'] -= coeff * 2 * mean1 / (std1**2 * std2)
-                            expanded_coeffs['X1^2*X2'] += coeff / (std1**2 * std2)
-                        elif feature_name == 'X1 X2^2':
-                            expanded_coeffs['constant'] -= coeff * mean1 * (mean2**2) / (std1 * std2**2)
-                            expanded_coeffs['X1'] += coeff * (mean2**2) / (std1 * std2**2)
-                            expanded_coeffs['X2'] += coeff * mean1 * 2 * mean2 / (std1 * std2**2)
-                            expanded_coeffs['X1*X2'] -= coeff * 2 * mean2 / (std1 * std2**2)
-                            expanded_coeffs['X2^2'] -= coeff * mean1 / (std1 * std2**2)
-                            expanded_coeffs['X1*X2^2'] += coeff / (std1 * std2**2)
-                        elif feature_name == 'X2^3':
-                            expanded_coeffs['constant'] -= coeff * (mean2**3) / (std2**3)
-                            expanded_coeffs['X2'] += coeff * 3 * (mean2**2) / (std2**3)
-                            expanded_coeffs['X2^2'] -= coeff * 3 * mean2 / (std2**3)
-                            expanded_coeffs['X2^3'] += coeff / (std2**3)
-                
-                # 构建多项式部分 - 使用更高精度
-                polynomial_terms = []
-                
-                # 常数项
-                polynomial_terms.append(f"{expanded_coeffs['constant']:.12f}")
-                
-                # 添加各项（如果系数足够大）
-                threshold = 1e-12
-                
-                if abs(expanded_coeffs['X1']) > threshold:
-                    polynomial_terms.append(f"{expanded_coeffs['X1']:.12f}*X1")
-                if abs(expanded_coeffs['X2']) > threshold:
-                    polynomial_terms.append(f"{expanded_coeffs['X2']:.12f}*X2")
-                if abs(expanded_coeffs['X1^2']) > threshold:
-                    polynomial_terms.append(f"{expanded_coeffs['X1^2']:.12f}*X1^2")
-                if abs(expanded_coeffs['X1*X2']) > threshold:
-                    polynomial_terms.append(f"{expanded_coeffs['X1*X2']:.12f}*X1*X2")
-                if abs(expanded_coeffs['X2^2']) > threshold:
-                    polynomial_terms.append(f"{expanded_coeffs['X2^2']:.12f}*X2^2")
-                    
-                if degree >= 3:
-                    if abs(expanded_coeffs['X1^3']) > threshold:
-                        polynomial_terms.append(f"{expanded_coeffs['X1^3']:.12f}*X1^3")
-                    if abs(expanded_coeffs['X1^2*X2']) > threshold:
-                        polynomial_terms.append(f"{expanded_coeffs['X1^2*X2']:.12f}*X1^2*X2")
-                    if abs(expanded_coeffs['X1*X2^2']) > threshold:
-                        polynomial_terms.append(f"{expanded_coeffs['X1*X2^2']:.12f}*X1*X2^2")
-                    if abs(expanded_coeffs['X2^3']) > threshold:
-                        polynomial_terms.append(f"{expanded_coeffs['X2^3']:.12f}*X2^3")
-                
-                # 组合多项式
-                polynomial = polynomial_terms[0]  # 常数项
-                for term in polynomial_terms[1:]:
-                    if term.startswith('-'):
-                        polynomial += f" - {term[1:]}"  # 负号已经在项中
-                    else:
-                        polynomial += f" + {term}"
+            expanded_coeffs = self._model_meta[model_name].expanded_coeffs
+            if expanded_coeffs is not None:
+                polynomial = format_polynomial(expanded_coeffs, degree)
                 
                 # 构建 log(Y) 公式用于显示
                 log_formula = f"log(Y) = {polynomial}"
@@ -1046,7 +1255,7 @@ class PredictionApp:
         self.solution_type_var = tk.StringVar()
         self.solution_type_var.set("NaOH")  # 默认选择NaOH
         
-        solutions = ["NaOH", "NaCl", "HCl"]
+        solutions = list(_SOLUTION_TYPES)
         self.solution_combo = ttk.Combobox(dropdown_container, 
                                           textvariable=self.solution_type_var,
                                           values=solutions,
@@ -1180,16 +1389,9 @@ class PredictionApp:
                                         text="Continue →", cursor="hand2")
     
     def get_property_name(self, model_name):
-        """获取属性显示名称"""
-        display_name = self.format_property_name(model_name)
-        # 移除溶液类型前缀
-        for solution in ["NaOH", "NaCl", "HCl"]:
-            if model_name.startswith(solution):
-                property_name = display_name.replace(f"{solution} ", "").replace(f"{solution}", "")
-                if property_name.startswith(" "):
-                    property_name = property_name[1:]
-                return property_name
-        return display_name
+        """获取属性显示名称 (加载模型时已去掉溶液类型前缀)"""
+        meta = self._model_meta[model_name]
+        return meta.property_name or meta.display_name
     
     def update_property_dropdown(self):
         """根据选择的溶液类型更新属性下拉选择器"""
@@ -1199,14 +1401,10 @@ class PredictionApp:
         available_properties = []
         self.property_model_map = {}  # 存储显示名称到模型名称的映射
         
-        for model_name in self.models.keys():
-            if model_name.startswith(selected_solution):
-                display_name = self.format_property_name(model_name)
-                property_name = display_name.replace(f"{selected_solution} ", "").replace(f"{selected_solution}", "")
-                property_name = property_name.strip()
-                if property_name:
-                    available_properties.append(property_name)
-                    self.property_model_map[property_name] = model_name
+        for meta in self._models_by_solution.get(selected_solution, []):
+            if meta.property_name:
+                available_properties.append(meta.property_name)
+                self.property_model_map[meta.property_name] = meta.stem
         
         # 按属性名称排序
         available_properties.sort()
@@ -1264,7 +1462,7 @@ class PredictionApp:
         if not model_name:
             return
         
-        display_name = self.format_property_name(model_name)
+        display_name = self._model_meta[model_name].display_name
         self.show_model_formula(model_name, display_name, self.selector_window)
     
     def show_model_formula(self, model_name, display_name, parent_window):
@@ -1428,6 +1626,8 @@ class PredictionApp:
         formula_window.protocol("WM_DELETE_WINDOW", return_to_selector)
 
 def main():
+    # 模型加载与Tk初始化并行进行
+    threading.Thread(target=PredictionApp.warm, daemon=True).start()
     root = tk.Tk()
     app = PredictionApp(root)
     root.mainloop()
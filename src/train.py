@@ -17,6 +17,8 @@ from sklearn.base            import BaseEstimator, TransformerMixin
 from sklearn.model_selection import train_test_split
 from sklearn.metrics         import mean_squared_error, r2_score
 
+from hcl_features import HCL_FEATURES, build_hcl_features
+
 # ─── CONFIG ────────────────────────────────────────────────────────────────
 DATA_DIR    = Path(__file__).parent.parent / "data"
 MODELS_DIR  = Path(__file__).parent.parent / "models"
@@ -24,6 +26,10 @@ MODELS_DIR.mkdir(exist_ok=True)
 LOG_TARGETS = {"viscosity"}   # apply log→exp for viscosity only (HCl uses polynomial without log)
 DEGREE      = 3
 BUBBLEPOINT_DEGREE = 2  # lower degree for bubble point to reduce overfitting
+# joblib compression for the saved pipelines. Keep 0: the file is well under 1 MB, and
+# compressed arrays cannot be memory-mapped by joblib.load(..., mmap_mode='r') in the GUI
+MODEL_COMPRESS = 0
+N_JOBS      = -1  # datasets fitted in parallel (one loky worker process per dataset)
 
 class AdvancedFeatureEngineer(BaseEstimator, TransformerMixin):
     """Advanced feature engineering for HCl vapor pressure"""
@@ -35,35 +41,15 @@ class AdvancedFeatureEngineer(BaseEstimator, TransformerMixin):
         return self
     
     def transform(self, X):
-        X_new = X.copy()
-        
-        # Temperature in Kelvin
-        T_K = X_new['X2'] + 273.15
-        
-        # Basic physics-based features
-        X_new['inv_T'] = 1 / T_K
-        X_new['log_T'] = np.log(T_K)
-        X_new['sqrt_T'] = np.sqrt(T_K)
-        
-        # Concentration-based features
-        X_new['log_X1'] = np.log(X_new['X1'] + 1)
-        X_new['sqrt_X1'] = np.sqrt(X_new['X1'])
-        X_new['X1_squared'] = X_new['X1'] ** 2
+        x1 = X['X1'].to_numpy(dtype=np.float64)
+        x2 = X['X2'].to_numpy(dtype=np.float64)
         
-        # Interaction terms
-        X_new['X1_inv_T'] = X_new['X1'] * X_new['inv_T']
-        X_new['X1_log_T'] = X_new['X1'] * X_new['log_T']
-        X_new['X1_sqrt_T'] = X_new['X1'] * X_new['sqrt_T']
-        
-        # Advanced interactions
-        X_new['X1_X2'] = X_new['X1'] * X_new['X2']
-        X_new['X1_X2_inv_T'] = X_new['X1'] * X_new['X2'] * X_new['inv_T']
-        
-        # Exponential/logarithmic combinations
-        X_new['exp_inv_T'] = np.exp(X_new['inv_T'])
-        X_new['X1_exp_inv_T'] = X_new['X1'] * np.exp(X_new['inv_T'])
-        
-        return X_new
+        # Compute all features into one column-major buffer (each feature column is contiguous
+        # for the ufunc writes), then hand pandas the same row-major layout as before: the array
+        # layout changes BLAS summation order in the MLP fit and with it the trained model
+        out = np.empty((len(X), len(HCL_FEATURES)), dtype=np.float64, order="F")
+        build_hcl_features(x1, x2, out)
+        return pd.DataFrame(np.ascontiguousarray(out), columns=HCL_FEATURES, index=X.index)
 
 def make_pipeline(log_tf: bool, degree: int = DEGREE, use_rf: bool = False, use_nn: bool = False):
     if use_nn:
@@ -97,7 +83,7 @@ def make_pipeline(log_tf: bool, degree: int = DEGREE, use_rf: bool = False, use_
         ])
     elif use_rf:
         # Random Forest for HCl vapor pressure
-        base_reg = RandomForestRegressor(n_estimators=100, random_state=42)
+        base_reg = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=1)  # datasets are already fitted in parallel
         if log_tf:
             reg = TransformedTargetRegressor(
                 regressor=base_reg,
@@ -113,7 +99,8 @@ def make_pipeline(log_tf: bool, degree: int = DEGREE, use_rf: bool = False, use_
         ])
     else:
         # Ridge regression for other properties
-        ridge = RidgeCV(alphas=np.logspace(-6,6,13), cv=5)
+        # efficient leave-one-out (generalized) CV from one SVD of the design matrix instead of 5-fold refits
+        ridge = RidgeCV(alphas=np.logspace(-6,6,13), cv=None, gcv_mode="svd")
         if log_tf:
             reg = TransformedTargetRegressor(
                 regressor=ridge,
@@ -130,67 +117,106 @@ def make_pipeline(log_tf: bool, degree: int = DEGREE, use_rf: bool = False, use_
             ("reg",     reg)
         ])
 
-def main():
-    models = {}
+def load_dataset(csv_path):
+    """Read one dataset and build its (unfitted) pipeline; returns (stem, X, y, pipe)."""
+    stem = csv_path.stem  # e.g. "viscosity" or "vapor_pressure"
+    df   = pd.read_csv(csv_path)
 
-    for csv_path in DATA_DIR.glob("*.csv"):
-        stem = csv_path.stem  # e.g. "viscosity" or "vapor_pressure"
-        df   = pd.read_csv(csv_path)
-
-        # Determine input features based on dataset
-        if "bubblepoint" in stem:
-            # Bubble point uses X1 (concentration) and X3 (pressure)
-            x_cols = ["X1", "X3"]
-            y_cols = [c for c in df.columns if c not in ("X1", "X3")]
-        elif "concentration" in stem:
-            # NaCl concentration uses X2 (temperature) and X4 (density)
-            x_cols = ["X2", "X4"]
-            y_cols = [c for c in df.columns if c not in ("X2", "X4")]
-        else:
-            # Other datasets use X1 (concentration) and X2 (temperature)
-            x_cols = ["X1", "X2"]
-            y_cols = [c for c in df.columns if c not in ("X1", "X2")]
-        
-        if len(y_cols) != 1:
-            raise ValueError(f"{csv_path.name} must have exactly one Y column, got {y_cols}")
-        y_col = y_cols[0]
+    # Determine input features based on dataset
+    if "bubblepoint" in stem:
+        # Bubble point uses X1 (concentration) and X3 (pressure)
+        x_cols = ["X1", "X3"]
+        y_cols = [c for c in df.columns if c not in ("X1", "X3")]
+    elif "concentration" in stem:
+        # NaCl concentration uses X2 (temperature) and X4 (density)
+        x_cols = ["X2", "X4"]
+        y_cols = [c for c in df.columns if c not in ("X2", "X4")]
+    else:
+        # Other datasets use X1 (concentration) and X2 (temperature)
+        x_cols = ["X1", "X2"]
+        y_cols = [c for c in df.columns if c not in ("X1", "X2")]
+    
+    if len(y_cols) != 1:
+        raise ValueError(f"{csv_path.name} must have exactly one Y column, got {y_cols}")
+    y_col = y_cols[0]
 
-        X = df[x_cols]
-        y = df[y_col]
-        
-        # Feature engineering for HCl vapor pressure
-        if "HCl" in stem and "vapor_pressure" in stem:
-            # Use advanced feature engineering for Neural Network
-            feature_eng = AdvancedFeatureEngineer()
-            X = feature_eng.fit_transform(X)
-        
-        X_tr, X_te, y_tr, y_te = train_test_split(X, y, test_size=0.2, random_state=42)
-
-        # Use Neural Network with log transform for HCl vapor pressure (best performance)
-        if "HCl" in stem and "vapor_pressure" in stem:
-            pipe = make_pipeline(log_tf=True, use_nn=True)  # Neural Network with log transform
-        elif "bubblepoint" in stem:
-            pipe = make_pipeline(log_tf=any(target in stem for target in LOG_TARGETS), degree=BUBBLEPOINT_DEGREE)
-        elif "NaOH_density" in stem:
-            pipe = make_pipeline(log_tf=any(target in stem for target in LOG_TARGETS), degree=2)  # Lower degree to prevent unphysical behavior
-        else:
-            pipe = make_pipeline(log_tf=any(target in stem for target in LOG_TARGETS))
-        pipe.fit(X_tr, y_tr)
+    X = df[x_cols]
+    y = df[y_col]
+    
+    # Feature engineering for HCl vapor pressure
+    if "HCl" in stem and "vapor_pressure" in stem:
+        # Use advanced feature engineering for Neural Network
+        feature_eng = AdvancedFeatureEngineer()
+        X = feature_eng.fit_transform(X)
+
+    # Use Neural Network with log transform for HCl vapor pressure (best performance)
+    if "HCl" in stem and "vapor_pressure" in stem:
+        pipe = make_pipeline(log_tf=True, use_nn=True)  # Neural Network with log transform
+    elif "bubblepoint" in stem:
+        pipe = make_pipeline(log_tf=any(target in stem for target in LOG_TARGETS), degree=BUBBLEPOINT_DEGREE)
+    elif "NaOH_density" in stem:
+        pipe = make_pipeline(log_tf=any(target in stem for target in LOG_TARGETS), degree=2)  # Lower degree to prevent unphysical behavior
+    else:
+        pipe = make_pipeline(log_tf=any(target in stem for target in LOG_TARGETS))
+    return stem, X, y, pipe
+
+def fit_group(datasets):
+    """Fit datasets that share the same X and preprocessing steps.
+
+    The split and the preprocessing (imputer/scaler/poly) are fitted once on the shared X;
+    only the final regressor is fitted per target. Returns [(stem, model entry, rmse, r2)].
+    """
+    X = datasets[0][1]
+    # the split depends only on the row count, so it is identical for every target
+    idx_tr, idx_te = train_test_split(np.arange(len(X)), test_size=0.2, random_state=42)
+    X_tr, X_te = X.iloc[idx_tr], X.iloc[idx_te]
+
+    prep = datasets[0][3][:-1]
+    Z_tr = prep.fit_transform(X_tr)
+    Z_te = prep.transform(X_te)
+
+    results = []
+    for stem, _, y, pipe in datasets:
+        y_tr, y_te = y.iloc[idx_tr], y.iloc[idx_te]
+        reg = pipe.steps[-1][1]
+        reg.fit(Z_tr, y_tr)
+        fitted = Pipeline(prep.steps + [pipe.steps[-1]])
 
         # evaluate
-        y_pred = pipe.predict(X_te)
+        y_pred = reg.predict(Z_te)
         rmse   = np.sqrt(mean_squared_error(y_te, y_pred))
         r2     = r2_score(y_te, y_pred)
-        print(f"{stem:15s} -> RMSE: {rmse:.4f},  R2: {r2:.4f}")
 
         # Store the actual features used (including engineered features)
         actual_features = list(X.columns)
-        models[stem] = {"model": pipe, "features": actual_features}
+        results.append((stem, {"model": fitted, "features": actual_features}, rmse, r2))
+    return results
+
+def main():
+    datasets = [load_dataset(csv_path) for csv_path in DATA_DIR.glob("*.csv")]
+
+    # group datasets whose inputs and preprocessing are identical so those steps are fitted once
+    groups = {}
+    for dataset in datasets:
+        _, X, _, pipe = dataset
+        groups.setdefault(joblib.hash((X, pipe[:-1])), []).append(dataset)
+
+    # groups are independent, so fit them in separate processes
+    results = joblib.Parallel(n_jobs=N_JOBS, backend="loky")(
+        joblib.delayed(fit_group)(group) for group in groups.values()
+    )
+    fitted = {stem: (entry, rmse, r2) for group in results for stem, entry, rmse, r2 in group}
+
+    models = {}
+    for stem, _, _, _ in datasets:
+        entry, rmse, r2 = fitted[stem]
+        print(f"{stem:15s} -> RMSE: {rmse:.4f},  R2: {r2:.4f}")
+        models[stem] = entry
 
-    # persist all pipelines in one file
+    # persist all pipelines in one file (see MODEL_COMPRESS)
     out_path = MODELS_DIR / "pipelines_by_target.pkl"
-    joblib.dump(models, out_path)
-    print(f"\nSaved {len(models)} models to {out_path}")
+    joblib.dump(models, out_path, compress=MODEL_COMPRESS)
+    print(f"\nSaved {len(models)} models to {out_path} ({out_path.stat().st_size / 1024:.0f} KB)")
 
 if __name__ == "__main__":
     main()